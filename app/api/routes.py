@@ -1,16 +1,27 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import hashlib
+from functools import partial
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from app.models import (
     SimulationRequest, 
     SimulationResponse,
     QuantumSimulationRequest,
-    QuantumSimulationResponse
+    QuantumSimulationResponse,
+    QuantumGridResponse,
+    EncodedArray
+)
+from app.physics.calculator import (
+    calculate_simulation,
+    quantum_grid,
+    quantum_wave_packet_simulation
 )
-from app.physics.calculator import calculate_simulation, quantum_wave_packet_simulation
 
 router = APIRouter()
 
 @router.post("/simulate", response_model=SimulationResponse)
-async def simulate(request: SimulationRequest):
+def simulate(request: SimulationRequest):
     """
     Endpoint to receive simulation data and return calculated results
     """
@@ -26,7 +37,7 @@ async def simulate(request: SimulationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/calculate")
-async def calculate(data: dict):
+def calculate(data: dict):
     """
     Alternative endpoint that accepts raw JSON
     """
@@ -40,18 +51,31 @@ async def calculate(data: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/quantum/simulate", response_model=QuantumSimulationResponse)
-async def quantum_simulate(request: QuantumSimulationRequest):
+async def quantum_simulate(request: QuantumSimulationRequest, http_request: Request):
     """
     Quantum wave packet scattering simulation endpoint
     
     Simulates a quantum wave packet scattering off a potential barrier.
-    Returns the time evolution of the wavefunction probability density.
+    Returns the time evolution of the wavefunction probability density
+    as a base64-encoded float32 buffer (one row of len(x_inner) per time).
+    The grid and potential are served by GET /quantum/grid.
     
     The wave packet starts at position x0 and moves toward the barrier.
     You can observe quantum tunneling and reflection effects.
+    
+    Frames always come from the spectral (eigenbasis) propagator, so only
+    the default method is accepted; method="crank-nicolson" applies to
+    /api/quantum-tunneling.
     """
+    if request.method != "spectral":
+        raise HTTPException(
+            status_code=422,
+            detail=f"method={request.method!r} is only supported by /api/quantum-tunneling"
+        )
+    
     try:
-        result = quantum_wave_packet_simulation(
+        simulation = partial(
+            quantum_wave_packet_simulation,
             mass=request.mass,
             hbar=request.hbar,
             xmin=request.xmin,
@@ -64,18 +88,69 @@ async def quantum_simulate(request: QuantumSimulationRequest):
             barrier_end=request.barrier_end,
             dt=request.dt,
             t_max=request.t_max,
-            num_time_steps=request.num_time_steps
+            num_time_steps=request.num_time_steps,
+            max_frames=500  # Downsample to max 500 frames
         )
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(http_request.app.state.pool, simulation)
         
-        return QuantumSimulationResponse(
-            x=result["x"],
-            x_inner=result["x_inner"],
-            potential=result["potential"],
-            initial_wavefunction=result["initial_wavefunction"],
-            time_evolution=result["time_evolution"],
-            eigenenergies=result["eigenenergies"],
-            barrier_height=result["barrier_height"],
-            status="success"
+        # Serialized directly with orjson: returning a Response bypasses
+        # response-model validation (the model still documents the schema)
+        content = {
+            "times": result["times"],
+            "time_evolution": EncodedArray.from_array(result["time_evolution"]).model_dump(),
+            "eigenenergies": result["eigenenergies"],
+            "status": "success"
+        }
+        return Response(
+            content=orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY),
+            media_type="application/json"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/quantum/grid", response_model=QuantumGridResponse)
+def quantum_simulation_grid(
+    http_request: Request,
+    mass: float = 1.0,
+    xmin: float = -6.5,
+    xmax: float = 6.5,
+    N: int = 1000,
+    momentum: float = 40.0,
+    barrier_start: float = 0.0,
+    barrier_end: float = 0.5
+):
+    """
+    Static grid and potential for the quantum simulation endpoint
+    
+    The result depends only on the query parameters, so it is sent with an
+    ETag derived from them; clients revalidate with If-None-Match and get
+    304 Not Modified instead of the arrays.
+    """
+    params = (mass, xmin, xmax, N, momentum, barrier_start, barrier_end)
+    etag = '"' + hashlib.sha1(repr(params).encode()).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=86400"}
+    
+    if_none_match = http_request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    
+    try:
+        result = quantum_grid(
+            mass=mass,
+            xmin=xmin,
+            xmax=xmax,
+            N=N,
+            momentum=momentum,
+            barrier_start=barrier_start,
+            barrier_end=barrier_end
+        )
+        
+        content = {**result, "status": "success"}
+        return Response(
+            content=orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY),
+            media_type="application/json",
+            headers=headers
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,13 +1,87 @@
-from fastapi import FastAPI, Response, HTTPException
+import asyncio
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Dict
+
+import blosc2
+from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
 from app.models import QuantumSimulationRequest
-from app.physics.calculator import quantum_tunneling_simulation_binary
+from app.physics import limit_threads
+from app.physics.calculator import (
+    SimulationParameterError,
+    quantum_tunneling_simulation_binary
+)
+
+# Simulation worker processes; the cores are split evenly between them so
+# each simulation's BLAS/LAPACK calls still run multithreaded. Defaults to
+# one worker per 4 cores, override with SIMULATION_WORKERS.
+CPU_COUNT = os.cpu_count() or 1
+SIMULATION_WORKERS = int(os.environ.get("SIMULATION_WORKERS") or max(1, CPU_COUNT // 4))
+
+# Recent binary simulation results, keyed by their (quantized) arguments.
+# Each entry maps a content encoding ("identity", "blosc2") to its payload,
+# so compressed variants are only produced once per result.
+RESULT_CACHE_SIZE = 32
+_result_cache: "OrderedDict[tuple, Dict[str, bytes]]" = OrderedDict()
+
+
+def _result_cache_key(simulation: partial) -> tuple:
+    """
+    Hashable key for a simulation call. Floats are rounded to 12 significant
+    digits (relative to their magnitude, so SI-scale values stay distinct)
+    to absorb FP noise.
+    """
+    return tuple(
+        (name, float(f"{value:.12g}") if isinstance(value, float) else value)
+        for name, value in sorted(simulation.keywords.items())
+    )
+
+
+def _accepts_blosc2(http_request: Request) -> bool:
+    """Whether the client opted into a blosc2-compressed payload"""
+    accept = http_request.headers.get("accept-encoding", "")
+    return "blosc2" in (token.split(";")[0].strip() for token in accept.split(","))
+
+
+def _blosc2_compress(payload: memoryview) -> bytes:
+    """Byte-shuffled zstd; every field of the payload is 4 bytes wide"""
+    return blosc2.compress(
+        payload,
+        typesize=4,
+        clevel=3,
+        filter=blosc2.Filter.SHUFFLE,
+        codec=blosc2.Codec.ZSTD
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Simulations run in worker processes so concurrent requests are not
+    # serialized on the GIL. "spawn" avoids forking a parent whose BLAS/FFT
+    # thread pools may already be running. Each worker gets its share of the
+    # cores so concurrent simulations do not oversubscribe the CPU.
+    app.state.pool = ProcessPoolExecutor(
+        max_workers=SIMULATION_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=limit_threads,
+        initargs=(max(1, CPU_COUNT // SIMULATION_WORKERS),)
+    )
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown(wait=True, cancel_futures=True)
 
 app = FastAPI(
     title="Physics Simulation API",
     description="Backend API for physics simulation calculations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware to allow frontend access
@@ -23,7 +97,7 @@ app.include_router(router, prefix="/api/v1", tags=["simulation"])
 
 
 @app.post("/api/quantum-tunneling")
-async def quantum_tunneling(request: QuantumSimulationRequest):
+async def quantum_tunneling(request: QuantumSimulationRequest, http_request: Request):
     """
     Quantum tunneling simulation endpoint - returns full simulation as binary
     
@@ -39,6 +113,9 @@ async def quantum_tunneling(request: QuantumSimulationRequest):
     1. Read header (8 bytes): frame_count, grid_size
     2. Read x array (grid_size * 4 bytes)
     3. For each frame, read psi_real (grid_size * 4) and psi_imag (grid_size * 4)
+    
+    Clients sending "Accept-Encoding: blosc2" get the same payload compressed
+    with blosc2 (zstd + shuffle) and a "Content-Encoding: blosc2" header.
     """
     try:
         # Calculate number of time steps
@@ -47,8 +124,9 @@ async def quantum_tunneling(request: QuantumSimulationRequest):
         else:
             num_time_steps = request.num_time_steps
         
-        # Run simulation and get binary data (all in memory)
-        binary_data = quantum_tunneling_simulation_binary(
+        # Run simulation in the process pool and get binary data (all in memory)
+        simulation = partial(
+            quantum_tunneling_simulation_binary,
             mass=request.mass,
             hbar=request.hbar,
             xmin=request.xmin,
@@ -62,25 +140,56 @@ async def quantum_tunneling(request: QuantumSimulationRequest):
             dt=request.dt,
             t_max=request.t_max,
             num_time_steps=num_time_steps,
-            max_frames=500  # Downsample to max 500 frames
+            max_frames=500,  # Downsample to max 500 frames
+            method=request.method
         )
         
+        # Identical requests are served from the result cache
+        key = _result_cache_key(simulation)
+        cached = _result_cache.get(key)
+        if cached is None:
+            loop = asyncio.get_running_loop()
+            binary_data = await loop.run_in_executor(http_request.app.state.pool, simulation)
+            cached = _result_cache[key] = {"identity": binary_data}
+            if len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+        else:
+            _result_cache.move_to_end(key)
+        
+        # Passed to the response as a memoryview so the payload is never copied
+        payload = memoryview(cached["identity"]).toreadonly()
+        
         # Calculate metadata for headers
         # Format: 8 bytes header + N*4 bytes x + frames*(N*4 + N*4) bytes
-        import struct
-        frame_count = struct.unpack('I', binary_data[0:4])[0]
-        grid_size = struct.unpack('I', binary_data[4:8])[0]
+        frame_count = int.from_bytes(payload[0:4], 'little')
+        grid_size = int.from_bytes(payload[4:8], 'little')
+        headers = {
+            "X-Frames": str(frame_count),
+            "X-Grid-Size": str(grid_size),
+            "X-Format": "header(uint32 frame_count, uint32 grid_size) + x[N](float32) + frames[psi_real[N], psi_imag[N]](float32)",
+            # The body depends on Accept-Encoding, for raw and compressed alike
+            "Vary": "Accept-Encoding"
+        }
+        
+        # float32 wavefunctions shrink by about 1.2x (their low mantissa bits
+        # are noise); blosc2 releases the GIL so compression runs in a thread
+        # off the event loop, once per cached result
+        if _accepts_blosc2(http_request):
+            if "blosc2" not in cached:
+                loop = asyncio.get_running_loop()
+                cached["blosc2"] = await loop.run_in_executor(None, _blosc2_compress, payload)
+            payload = cached["blosc2"]
+            headers["Content-Encoding"] = "blosc2"
+        headers["Content-Length"] = str(len(payload))
         
         return Response(
-            content=binary_data,
+            content=payload,
             media_type="application/octet-stream",
-            headers={
-                "X-Frames": str(frame_count),
-                "X-Grid-Size": str(grid_size),
-                "X-Format": "header(uint32 frame_count, uint32 grid_size) + x[N](float32) + frames[psi_real[N], psi_imag[N]](float32)",
-                "Content-Length": str(len(binary_data))
-            }
+            headers=headers
         )
+    except SimulationParameterError as e:
+        # Parameters the simulation cannot run faithfully (e.g. dt too coarse)
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
 
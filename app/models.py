@@ -1,5 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
+import base64
+import numpy as np
 
 class SimulationRequest(BaseModel):
     """Base model for simulation input data"""
@@ -37,15 +39,35 @@ class QuantumSimulationRequest(BaseModel):
     dt: float = 0.001
     t_max: float = 2.0
     num_time_steps: Optional[int] = None  # If None, calculate from dt and t_max
+    method: Literal["spectral", "crank-nicolson"] = "spectral"  # Binary endpoint only; JSON endpoint rejects others
+
+class EncodedArray(BaseModel):
+    """Raw array buffer embedded in JSON (base64 of the array bytes)"""
+    dtype: str  # NumPy dtype string, e.g. "<f4" for little-endian float32
+    shape: List[int]
+    data: str  # base64-encoded C-order array bytes
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "EncodedArray":
+        arr = np.ascontiguousarray(arr)
+        return cls(
+            dtype=arr.dtype.str,
+            shape=list(arr.shape),
+            data=base64.b64encode(arr.data).decode("ascii")
+        )
 
 class QuantumSimulationResponse(BaseModel):
     """Response model for quantum simulation results (JSON endpoint)"""
+    times: List[float]
+    time_evolution: EncodedArray  # float32 frames, shape (len(times), len(x_inner))
+    eigenenergies: List[float]
+    status: str = "success"
+
+class QuantumGridResponse(BaseModel):
+    """Response model for the static grid and potential of a simulation"""
     x: List[float]
     x_inner: List[float]  # Interior points for wavefunction
     potential: List[float]
-    initial_wavefunction: List[float]
-    time_evolution: List[Dict[str, Any]]  # List of {time: float, wavefunction: List[float]}
-    eigenenergies: List[float]
     barrier_height: float
     status: str = "success"
 
@@ -1,3 +1,19 @@
 """
 Physics calculation modules
 """
+import os
+
+# Thread-count variables read by OpenBLAS, MKL and OpenMP when NumPy/SciPy load
+THREAD_ENV_VARS = ("OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "OMP_NUM_THREADS")
+
+
+def limit_threads(num_threads: int) -> None:
+    """
+    Process pool initializer: cap the BLAS/LAPACK threads of a worker
+    
+    Runs in the freshly spawned worker before any task (and therefore before
+    NumPy) is imported there; this package deliberately imports no NumPy.
+    Thread counts set explicitly in the environment still win.
+    """
+    for var in THREAD_ENV_VARS:
+        os.environ.setdefault(var, str(num_threads))
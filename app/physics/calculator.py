@@ -3,9 +3,21 @@ Physics calculation module
 Add your physics simulation logic here
 """
 from typing import Dict, Any, List, Optional
+import functools
 import numpy as np
+import scipy.linalg
 import struct
-from io import BytesIO
+
+# Working-set budget for one block of frame coefficients (typical per-core L2)
+L2_CACHE_BYTES = 1 << 20
+
+# Largest E_max*dt/hbar accepted by the Crank-Nicolson propagator. Its phase
+# error grows as (E*dt/hbar)^2; at 0.1 the frames stay within ~1% of the
+# exact spectral result over the default run, beyond it they degrade fast.
+CRANK_NICOLSON_MAX_PHASE = 0.1
+
+class SimulationParameterError(ValueError):
+    """Requested parameters the simulation cannot run faithfully"""
 
 def calculate_simulation(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -40,8 +52,10 @@ def quantum_tunneling_simulation_binary(
     dt: float = 0.001,
     t_max: float = 2.0,
     num_time_steps: Optional[int] = None,
-    max_frames: int = 500
-) -> bytes:
+    max_frames: int = 500,
+    method: str = "spectral",
+    eps: float = 1e-8
+) -> bytearray:
     """
     Quantum wave packet scattering simulation - returns binary data
     
@@ -63,53 +77,43 @@ def quantum_tunneling_simulation_binary(
         t_max: Maximum simulation time
         num_time_steps: Number of time steps (if None, calculated from dt and t_max)
         max_frames: Maximum number of frames to output (downsampling)
+        method: Time propagator. "spectral" expands Psi0 in the (cached)
+            eigenbasis and evaluates each frame exactly; "crank-nicolson"
+            steps Psi0 forward with a tridiagonal solve per time step (O(N)
+            per step, no eigenvectors), which is cheaper when there are many
+            more time steps than grid points but needs a small dt: a
+            SimulationParameterError is raised when E_max*dt/hbar exceeds
+            CRANK_NICOLSON_MAX_PHASE, E_max = 2*hbar^2/(m*dx^2) + V0
+        eps: Spectral method only; eigenstates whose overlap with Psi0 is below
+            eps * max(|c|) are dropped from the expansion
         
     Returns:
-        Binary data (bytes) containing the simulation results
+        Binary data (bytearray, wrap in a memoryview to send without copying)
+        containing the simulation results
     """
-    # Create spatial grid (N+1 points, but we use N interior points)
-    x_full = np.linspace(xmin, xmax, N + 1)
-    dx = x_full[1] - x_full[0]
+    # Create spatial grid (N+1 points, but we use N interior points) and potential
+    x_full, dx, V_full, V0 = _grid_and_potential(
+        mass, xmin, xmax, N, momentum, barrier_start, barrier_end
+    )
     
     # Use interior points for wavefunction (N-1 points)
     x_inner = x_full[1:-1]
+    V = V_full[1:-1]
     grid_size = len(x_inner)
     
-    # Calculate potential barrier height according to the kinetic energy
-    V0 = momentum**2 / (2 * mass)
-    
-    # Create potential array (on interior points)
-    V = np.zeros_like(x_inner)
-    for i in range(len(V)):
-        if x_inner[i] > barrier_start and x_inner[i] < barrier_end:
-            V[i] = V0
-    
-    # Initial wavefunction (Gaussian wave packet)
-    Psi0 = (np.exp(-((x_inner - x0)**2) / sigma**2) * 
-            np.exp(1j * momentum * (x_inner - x0)))
+    # Crank-Nicolson stays stable at any dt but silently loses accuracy, so
+    # a step too coarse for the grid's highest energy is rejected up front
+    if method == "crank-nicolson":
+        E_max = 2 * hbar**2 / (mass * dx**2) + V0
+        if E_max * dt / hbar > CRANK_NICOLSON_MAX_PHASE:
+            raise SimulationParameterError(
+                f"dt={dt:g} is too large for Crank-Nicolson on this grid "
+                f"(E_max*dt/hbar = {E_max * dt / hbar:.3g} > {CRANK_NICOLSON_MAX_PHASE}); "
+                f"use dt <= {CRANK_NICOLSON_MAX_PHASE * hbar / E_max:.3g} or method=\"spectral\""
+            )
     
-    # Normalize initial wavefunction
-    A = np.sum(np.abs(Psi0)**2 * dx)
-    Psi0 = Psi0 / np.sqrt(A)
-    
-    # Construct Hamiltonian matrix (finite difference method)
-    H = ((hbar**2 / (mass * dx**2)) * np.diag(np.ones(grid_size)) +
-         V * np.diag(np.ones(grid_size)) +
-         (-hbar**2 / (2 * mass * dx**2)) * np.diag(np.ones(grid_size - 1), 1) +
-         (-hbar**2 / (2 * mass * dx**2)) * np.diag(np.ones(grid_size - 1), -1))
-    
-    # Solve eigenvalue problem ONCE: H|psi> = E|psi>
-    E, psi = np.linalg.eigh(H)
-    psi = psi.T  # Transpose so each row is an eigenstate
-    
-    # Normalize eigenstates
-    A = np.sum(np.abs(psi[0])**2 * dx)
-    psi = psi / np.sqrt(A)
-    
-    # Project initial wavefunction onto eigenstates
-    c = np.zeros(len(Psi0), dtype=complex)
-    for i in range(len(c)):
-        c[i] = np.sum(np.conj(psi[i]) * Psi0 * dx)
+    # Initial wavefunction (normalized Gaussian wave packet)
+    Psi0 = _gaussian_wave_packet(x_inner, dx, x0, sigma, momentum)
     
     # Time evolution with downsampling
     if num_time_steps is None:
@@ -121,47 +125,309 @@ def quantum_tunneling_simulation_binary(
     else:
         downsample_stride = 1
     
-    # Collect frames (complex wavefunction)
-    frames = []
-    for step in range(0, num_time_steps, downsample_stride):
-        t = step * dt
-        Psi = np.zeros_like(psi[0], dtype=complex)
+    # Frame times to emit (at most max_frames)
+    t_array = np.arange(0, num_time_steps, downsample_stride)[:max_frames] * dt
+    frame_count = len(t_array)
+    
+    # Preallocate the whole payload: header + x[N] + frames[N real, N imag]
+    x_offset = 8
+    frames_offset = x_offset + 4 * grid_size
+    buffer = bytearray(frames_offset + 8 * grid_size * frame_count)
+    
+    # Write HEADER: uint32 frame_count, uint32 grid_size
+    struct.pack_into('<II', buffer, 0, frame_count, grid_size)
+    
+    # Write DATA: x array (float32)
+    x_out = np.frombuffer(buffer, dtype=np.float32, count=grid_size, offset=x_offset)
+    x_out[:] = x_inner
+    
+    # FRAMES are written in place as one SoA block:
+    # out[k, 0] = psi_real[N], out[k, 1] = psi_imag[N]
+    out = np.frombuffer(buffer, dtype=np.float32, count=2 * grid_size * frame_count,
+                        offset=frames_offset).reshape(frame_count, 2, grid_size)
+    
+    if method == "crank-nicolson":
+        _crank_nicolson_frames(out, Psi0, V, dx, mass, hbar, dt, downsample_stride)
+    elif method == "spectral":
+        # Eigenstates of the Hamiltonian, shared by requests with the same physics
+        E, psi = _eigensystem(mass, hbar, xmin, xmax, N, momentum, barrier_start, barrier_end)
+        _spectral_frames(out, Psi0, E, psi, hbar, t_array, dt * downsample_stride, eps)
+    else:
+        raise ValueError(f"Unknown method: {method!r}")
+    
+    return buffer
+
+def _spectral_frames(
+    out: np.ndarray,
+    Psi0: np.ndarray,
+    E: np.ndarray,
+    psi: np.ndarray,
+    hbar: float,
+    t_array: np.ndarray,
+    frame_dt: float,
+    eps: float
+) -> None:
+    """
+    Exact eigenbasis time evolution shared by the simulation endpoints
+    
+    Expands Psi0 in the eigenstates (E, psi from _eigensystem) and writes the
+    frames at the evenly spaced times t_array (spacing frame_dt) into
+    out[k, 0] (real) and out[k, 1] (imag). Eigenstates whose overlap with
+    Psi0 is below eps * max(|c|) are dropped.
+    """
+    # Project initial wavefunction onto eigenstates. The eigenvectors are real,
+    # so conj() is a no-op; projecting the real and imaginary parts separately
+    # keeps both products real (no complex copy of psi).
+    # With unit-norm eigenvectors the 1/sqrt(dx) normalization of the
+    # eigenstates and the dx of the projection integral cancel, so
+    # c = psi @ Psi0 and Psi(t) = sum(c[i] * psi[i] * ...) need neither
+    c = psi @ Psi0.real + 1j * (psi @ Psi0.imag)
+    
+    # A Gaussian packet only overlaps eigenstates in a narrow band around
+    # E ~ p^2/2m; dropping the rest shrinks the matmuls from N to K states
+    abs_c = np.abs(c)
+    keep = abs_c > eps * abs_c.max()
+    E, psi, c = E[keep], psi[keep], c[keep]
+    
+    # out is float32, so frames are computed in single precision. The
+    # matmul inputs are 64-byte aligned; the frame rows of the binary
+    # payload sit at 8 + 4*N bytes and cannot be without a format change.
+    psi_f32 = _aligned_empty(psi.shape, np.float32)
+    psi_f32[...] = psi
+    psi = psi_f32
+    c = c.astype(np.complex64)
+    
+    # Frames are evenly spaced, so the phases exp(-i*E*t/hbar) form a
+    # geometric progression in the frame index with ratio step. Phase
+    # angles reach ~1e4 rad, so they are reduced mod 2*pi in float64
+    # before dropping to single precision.
+    step = np.exp(-1j * np.mod(E * (frame_dt / hbar), 2 * np.pi))
+    step = step.astype(np.complex64)
+    
+    # Time evolution: Psi(t) = sum(c[i] * psi[i] * exp(-i*E[i]*t/hbar)),
+    # evaluated as (frames x states) @ (states x N) matmuls over blocks of
+    # frames sized so each block's coefficients stay in L2 while psi is reused
+    frame_count, _, grid_size = out.shape
+    block_frames = max(1, L2_CACHE_BYTES // (grid_size * 8))
+    nb, K = min(block_frames, frame_count), len(E)
+    phase = np.empty((nb, K), dtype=np.complex64)
+    # The SGEMMs read the coefficients as two contiguous, aligned float32
+    # planes (strided .real/.imag views would be copied before each call)
+    coef_real = _aligned_empty((nb, K), np.float32)
+    coef_imag = _aligned_empty((nb, K), np.float32)
+    for b0 in range(0, frame_count, block_frames):
+        b1 = min(b0 + block_frames, frame_count)
+        block = phase[:b1 - b0]
         
-        # Time evolution: Psi(t) = sum(c[i] * psi[i] * exp(-i*E[i]*t/hbar))
-        for i in range(len(c)):
-            Psi = Psi + c[i] * psi[i] * np.exp(-1j * E[i] * t / hbar)
+        # Each block starts from an exact exp (bounding float32 drift to one
+        # block) and advances by repeated multiplication with step
+        block[0] = np.exp(-1j * np.mod(E * (t_array[b0] / hbar), 2 * np.pi))
+        block[1:] = step
+        np.cumprod(block, axis=0, out=block)
+        block *= c
+        coef_real[:b1 - b0] = block.real
+        coef_imag[:b1 - b0] = block.imag
         
-        frames.append(Psi)
+        # psi is real, so each half is a real SGEMM straight into out
+        np.matmul(coef_real[:b1 - b0], psi, out=out[b0:b1, 0])
+        np.matmul(coef_imag[:b1 - b0], psi, out=out[b0:b1, 1])
+
+def _crank_nicolson_frames(
+    out: np.ndarray,
+    Psi0: np.ndarray,
+    V: np.ndarray,
+    dx: float,
+    mass: float,
+    hbar: float,
+    dt: float,
+    downsample_stride: int
+) -> None:
+    """
+    Crank-Nicolson time stepping for the binary simulation
+    
+    Solves (I + iH dt/2hbar) Psi_{n+1} = (I - iH dt/2hbar) Psi_n with the
+    left-hand tridiagonal matrix LU-factored once, and writes every
+    downsample_stride-th step into out[k, 0] (real) and out[k, 1] (imag).
+    """
+    frame_count = out.shape[0]
+    if frame_count == 0:
+        return
+    
+    # Hamiltonian diagonals (finite difference method)
+    h_diag = hbar**2 / (mass * dx**2) + V
+    h_off = -hbar**2 / (2 * mass * dx**2)
+    a = 1j * dt / (2 * hbar)
+    
+    # Left-hand side (I + aH): factor once
+    lhs_off = np.full(len(V) - 1, a * h_off, dtype=complex)
+    dl, d, du, du2, ipiv, info = scipy.linalg.lapack.zgttrf(lhs_off, 1 + a * h_diag, lhs_off)
+    if info != 0:
+        raise ValueError("Crank-Nicolson matrix is singular")
+    
+    # Right-hand side (I - aH) applied as a three-point stencil
+    rhs_diag = 1 - a * h_diag
+    rhs_off = -a * h_off
+    
+    Psi = Psi0.astype(complex)
+    rhs = np.empty_like(Psi)
+    for step in range((frame_count - 1) * downsample_stride + 1):
+        if step % downsample_stride == 0:
+            k = step // downsample_stride
+            out[k, 0] = Psi.real
+            out[k, 1] = Psi.imag
+            if k == frame_count - 1:
+                break
         
-        # Stop if we've reached max_frames
-        if len(frames) >= max_frames:
-            break
+        np.multiply(rhs_diag, Psi, out=rhs)
+        rhs[:-1] += rhs_off * Psi[1:]
+        rhs[1:] += rhs_off * Psi[:-1]
+        Psi, info = scipy.linalg.lapack.zgttrs(dl, d, du, du2, ipiv, rhs)
+        if info != 0:
+            raise ValueError(f"Crank-Nicolson solve failed (zgttrs info={info})")
+
+def _grid_and_potential(
+    mass: float,
+    xmin: float,
+    xmax: float,
+    N: int,
+    momentum: float,
+    barrier_start: float,
+    barrier_end: float
+):
+    """
+    Spatial grid and barrier potential shared by the simulation endpoints
+    
+    Returns:
+        Tuple (x, dx, V, V0): grid of N + 1 points, grid spacing,
+        potential on the grid, and barrier height
+    """
+    # Create spatial grid
+    # Divides space to [xmin, xmax] into N + 1 points
+    x = np.linspace(xmin, xmax, N + 1)
+    dx = x[1] - x[0]
+    
+    # Calculate potential barrier height according to the kinetic energy
+    V0 = momentum**2 / (2 * mass)
     
-    frame_count = len(frames)
+    # Create potential array
+    V = np.zeros_like(x)
+    V[(x > barrier_start) & (x < barrier_end)] = V0
+    
+    return x, dx, V, V0
+
+def _gaussian_wave_packet(
+    x: np.ndarray,
+    dx: float,
+    x0: float,
+    sigma: float,
+    momentum: float
+) -> np.ndarray:
+    """
+    Gaussian wave packet centered at x0, normalized so sum(|Psi0|^2 * dx) = 1
     
-    # Write binary data to BytesIO buffer
-    buffer = BytesIO()
+    exp(-((x - x0)/sigma)^2) * exp(i*p*(x - x0)) is evaluated as a single
+    complex exponential. The norm comes from the real part of the exponent
+    (|exp(z)|^2 = exp(2*Re(z))) and is folded into the exponent as well.
+    """
+    u = x - x0
+    arg = -(u / sigma)**2 + 1j * momentum * u
+    A = np.sum(np.exp(2 * arg.real)) * dx
+    return np.exp(arg - 0.5 * np.log(A))
+
+def _aligned_empty(shape, dtype, align: int = 64) -> np.ndarray:
+    """
+    np.empty whose data pointer is a multiple of align bytes (a cache line,
+    and the AVX-512 vector width), so BLAS kernels can use aligned loads
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buf = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -buf.ctypes.data % align
+    return buf[offset:offset + nbytes].view(dtype).reshape(shape)
+
+# psi is (N-1)^2 float64, ~8 MB per entry at N=1000. Every pool worker holds
+# its own cache and requests go to whichever worker is idle, so a repeated
+# grid only hits when it lands on a worker that already solved it (identical
+# requests are answered by the server's result cache before reaching a
+# worker). Memory is maxsize entries per worker, hence the small size.
+@functools.lru_cache(maxsize=2)
+def _eigensystem(
+    mass: float,
+    hbar: float,
+    xmin: float,
+    xmax: float,
+    N: int,
+    momentum: float,
+    barrier_start: float,
+    barrier_end: float
+):
+    """
+    Eigenstates of the finite-difference Hamiltonian on the interior grid
     
-    # Write HEADER
-    buffer.write(struct.pack('I', frame_count))  # uint32 frame_count
-    buffer.write(struct.pack('I', grid_size))    # uint32 grid_size
+    Depends only on the grid and potential, so the result is cached and
+    reused by requests that differ in time range, frames or initial state.
     
-    # Write DATA: x array (float32)
-    x_float32 = x_inner.astype(np.float32)
-    buffer.write(x_float32.tobytes())
+    Returns:
+        Tuple (E, psi): eigenvalues and orthonormal eigenvectors (one per
+        row, unit Euclidean norm as returned by LAPACK), both read-only
+    """
+    _, dx, V_full, _ = _grid_and_potential(
+        mass, xmin, xmax, N, momentum, barrier_start, barrier_end
+    )
+    V = V_full[1:-1]
+    grid_size = len(V)
+    
+    # Hamiltonian (finite difference method) is symmetric tridiagonal:
+    # only its main and off diagonals are built
+    d = np.full(grid_size, hbar**2 / (mass * dx**2)) + V
+    e = np.full(grid_size - 1, -hbar**2 / (2 * mass * dx**2))
+    
+    # Solve eigenvalue problem: H|psi> = E|psi> (MRRR solver)
+    E, psi = scipy.linalg.eigh_tridiagonal(d, e, lapack_driver='stemr')
+    psi = psi.T  # Transpose so each row is an eigenstate (C-contiguous for GEMM)
+    
+    # Cached arrays are shared between calls
+    E.setflags(write=False)
+    psi.setflags(write=False)
+    
+    return E, psi
+
+def quantum_grid(
+    mass: float = 1.0,
+    xmin: float = -6.5,
+    xmax: float = 6.5,
+    N: int = 1000,
+    momentum: float = 40.0,
+    barrier_start: float = 0.0,
+    barrier_end: float = 0.5
+) -> Dict[str, Any]:
+    """
+    Static spatial grid and potential for the JSON simulation endpoint
     
-    # Write FRAMES: psi_real[N] and psi_imag[N] for each frame
-    for Psi in frames:
-        psi_real = np.real(Psi).astype(np.float32)
-        psi_imag = np.imag(Psi).astype(np.float32)
-        buffer.write(psi_real.tobytes())
-        buffer.write(psi_imag.tobytes())
+    These depend only on the grid and barrier parameters, so clients can
+    fetch and cache them once instead of receiving them with every simulation.
     
-    # Get binary data
-    binary_data = buffer.getvalue()
-    buffer.close()
+    Args:
+        mass: Particle mass
+        xmin, xmax: Spatial grid boundaries
+        N: Number of grid points
+        momentum: Initial momentum (sets the barrier height)
+        barrier_start, barrier_end: Potential barrier boundaries
+        
+    Returns:
+        Dictionary with the grid, interior points, potential (NumPy arrays,
+        serialized directly by orjson) and barrier height
+    """
+    x, dx, V, V0 = _grid_and_potential(
+        mass, xmin, xmax, N, momentum, barrier_start, barrier_end
+    )
     
-    return binary_data
+    return {
+        "x": x,
+        "x_inner": x[1:-1],  # For wavefunction data (N-1 points)
+        "potential": V,
+        "barrier_height": float(V0)
+    }
 
 def quantum_wave_packet_simulation(
     mass: float = 1.0,
@@ -176,7 +442,9 @@ def quantum_wave_packet_simulation(
     barrier_end: float = 0.5,
     dt: float = 0.001,
     t_max: float = 2.0,
-    num_time_steps: Optional[int] = None
+    num_time_steps: Optional[int] = None,
+    max_frames: int = 500,
+    eps: float = 1e-8
 ) -> Dict[str, Any]:
     """
     Quantum wave packet scattering simulation (legacy JSON endpoint)
@@ -196,78 +464,49 @@ def quantum_wave_packet_simulation(
         dt: Time step
         t_max: Maximum simulation time
         num_time_steps: Number of time steps (if None, calculated from dt and t_max)
+        max_frames: Maximum number of frames to output (downsampling)
+        eps: Eigenstates whose overlap with Psi0 is below eps * max(|c|)
+            are dropped from the expansion
         
     Returns:
-        Dictionary with simulation results including time evolution
+        Dictionary with the time evolution (frames as a float32 array with
+        one row per recorded time) and eigenenergies, as NumPy arrays.
+        The grid and potential are returned by quantum_grid().
     """
-    # Create spatial grid
-    # Divides space to [xmin, xmax] into N + 1 points
-    x = np.linspace(xmin, xmax, N + 1)
-    dx = x[1] - x[0]
-    
-    # Calculate potential barrier height according to the kinetic energy
-    V0 = momentum**2 / (2 * mass)
+    # Spatial grid (also served separately by quantum_grid())
+    x, dx, _, _ = _grid_and_potential(
+        mass, xmin, xmax, N, momentum, barrier_start, barrier_end
+    )
     
-    # Create potential array
-    V = np.zeros_like(x)
-    for i in range(len(V)):
-        if x[i] > barrier_start and x[i] < barrier_end:
-            V[i] = V0
-    
-    # Initial wavefunction (Gaussian wave packet)
+    # Initial wavefunction (normalized Gaussian wave packet)
     x_inner = x[1:-1]  # Interior points (N-1 points)
-    # Fixed: use (x_inner - x0) for proper Gaussian centering
-    Psi0 = (np.exp(-((x_inner - x0)**2) / sigma**2) * 
-            np.exp(1j * momentum * (x_inner - x0)))
-    
-    # Normalize initial wavefunction
-    A = np.sum(np.abs(Psi0)**2 * dx)
-    Psi0 = Psi0 / np.sqrt(A)
-    
-    # Construct Hamiltonian matrix (finite difference method)
-    H = ((hbar**2 / (mass * dx**2)) * np.diag(np.ones(N - 1)) +
-         V[1:-1] * np.diag(np.ones(N - 1)) +
-         (-hbar**2 / (2 * mass * dx**2)) * np.diag(np.ones(N - 2), 1) +
-         (-hbar**2 / (2 * mass * dx**2)) * np.diag(np.ones(N - 2), -1))
-    
-    # Solve eigenvalue problem: H|psi> = E|psi>
-    E, psi = np.linalg.eigh(H)
-    psi = psi.T  # Transpose so each row is an eigenstate
-    
-    # Normalize eigenstates
-    A = np.sum(np.abs(psi[0])**2 * dx)
-    psi = psi / np.sqrt(A)
-    
-    # Project initial wavefunction onto eigenstates
-    c = np.zeros(len(Psi0), dtype=complex)
-    for i in range(len(c)):
-        c[i] = np.sum(np.conj(psi[i]) * Psi0 * dx)
+    Psi0 = _gaussian_wave_packet(x_inner, dx, x0, sigma, momentum)
     
     # Time evolution
     if num_time_steps is None:
         num_time_steps = int(t_max / dt)
     
-    time_evolution = []
-    for step in range(num_time_steps):
-        t = step * dt
-        Psi = np.zeros_like(psi[0], dtype=complex)
-        
-        # Time evolution: Psi(t) = sum(c[i] * psi[i] * exp(-i*E[i]*t/hbar))
-        for i in range(len(c)):
-            Psi = Psi + c[i] * psi[i] * np.exp(-1j * E[i] * t / hbar)
-        
-        time_evolution.append({
-            "time": float(t),
-            "wavefunction": np.abs(Psi).tolist()  # Probability density
-        })
+    # Calculate downsampling stride
+    if num_time_steps > max_frames:
+        downsample_stride = num_time_steps // max_frames
+    else:
+        downsample_stride = 1
+    
+    # Only every downsample_stride-th step is recorded, up to max_frames
+    recorded_steps = np.arange(0, num_time_steps, downsample_stride)[:max_frames]
+    times = recorded_steps * dt
+    
+    # Same exact eigenbasis evolution (and cached eigensystem) as the binary
+    # endpoint, so both return the same physics; its cost does not depend on
+    # dt or on the barrier height
+    E, psi = _eigensystem(mass, hbar, xmin, xmax, N, momentum, barrier_start, barrier_end)
+    Psi_t = np.empty((len(times), 2, len(x_inner)), dtype=np.float32)
+    _spectral_frames(Psi_t, Psi0, E, psi, hbar, times, dt * downsample_stride, eps)
+    frames = np.hypot(Psi_t[:, 0], Psi_t[:, 1])  # |Psi|
     
     return {
-        "x": x.tolist(),
-        "x_inner": x_inner.tolist(),  # For wavefunction data (N-1 points)
-        "potential": V.tolist(),
-        "initial_wavefunction": np.abs(Psi0).tolist(),
-        "time_evolution": time_evolution,
-        "eigenenergies": E.tolist(),
-        "barrier_height": float(V0)
+        "times": times,
+        "time_evolution": frames,  # float32 array, shape (frame_count, N-1); frame 0 is |Psi0|
+        "eigenenergies": E[:200]  # Lowest (up to 200) eigenenergies, ascending
     }
 
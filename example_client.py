@@ -9,6 +9,7 @@ This example shows how to:
 
 import requests
 import struct
+import blosc2
 import numpy as np
 
 # Example parameters for quantum tunneling simulation
@@ -31,7 +32,8 @@ params = {
 print("Sending request to quantum tunneling endpoint...")
 response = requests.post(
     "http://localhost:8000/api/quantum-tunneling",
-    json=params
+    json=params,
+    headers={"Accept-Encoding": "blosc2"}
 )
 
 if response.status_code != 200:
@@ -43,43 +45,36 @@ print(f"✅ Response received: {len(response.content)} bytes")
 print(f"   Headers: X-Frames={response.headers.get('X-Frames')}, "
       f"X-Grid-Size={response.headers.get('X-Grid-Size')}")
 
-# Parse binary data
+# Parse binary data (decompressing first if the server used blosc2)
 binary_data = response.content
+if response.headers.get('Content-Encoding') == 'blosc2':
+    binary_data = blosc2.decompress(binary_data)
 offset = 0
 
-# Read header
-frame_count = struct.unpack('I', binary_data[offset:offset+4])[0]
-offset += 4
-grid_size = struct.unpack('I', binary_data[offset:offset+4])[0]
-offset += 4
+# Read header (little-endian uint32 pair)
+frame_count, grid_size = struct.unpack_from('<II', binary_data, offset)
+offset += 8
 
 print(f"\n📊 Simulation Info:")
 print(f"   Frame count: {frame_count}")
 print(f"   Grid size: {grid_size}")
 
 # Read x array
-x_bytes = binary_data[offset:offset + grid_size * 4]
-x = np.frombuffer(x_bytes, dtype=np.float32)
-offset += grid_size * 4
+x = np.frombuffer(binary_data, dtype=np.float32, count=grid_size, offset=offset)
+offset += x.nbytes
 
 print(f"   X range: [{x[0]:.3f}, {x[-1]:.3f}]")
 
-# Read frames
-frames = []
-for i in range(frame_count):
-    # Read psi_real
-    psi_real_bytes = binary_data[offset:offset + grid_size * 4]
-    psi_real = np.frombuffer(psi_real_bytes, dtype=np.float32)
-    offset += grid_size * 4
-    
-    # Read psi_imag
-    psi_imag_bytes = binary_data[offset:offset + grid_size * 4]
-    psi_imag = np.frombuffer(psi_imag_bytes, dtype=np.float32)
-    offset += grid_size * 4
-    
-    # Calculate probability density: |ψ|² = real² + imag²
-    probability = psi_real**2 + psi_imag**2
-    frames.append(probability)
+# Read all frames at once: shape (frame_count, 2, grid_size) where
+# [:, 0] is psi_real and [:, 1] is psi_imag
+psi = np.frombuffer(binary_data, dtype=np.float32,
+                    count=2 * grid_size * frame_count,
+                    offset=offset).reshape(frame_count, 2, grid_size)
+offset += psi.nbytes
+
+# Calculate probability density: |ψ|² = real² + imag², summed over the
+# real/imag axis in a single pass without squared temporaries
+frames = np.einsum('fkn,fkn->fn', psi, psi)
 
 print(f"\n✅ Parsed {len(frames)} frames successfully")
 print(f"   Frame shape: {frames[0].shape}")
@@ -93,6 +88,6 @@ for i in sample_frames:
     print(f"   Frame {i}: {norm:.6f}")
 
 print(f"\n✨ Success! Ready to visualize {frame_count} frames.")
-print(f"   Total data transferred: {len(binary_data):,} bytes")
+print(f"   Total data transferred: {len(response.content):,} bytes")
 print(f"   Single HTTP request - no disk I/O!")
 
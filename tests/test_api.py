@@ -0,0 +1,94 @@
+"""
+HTTP behaviour of the API, exercised through the app's lifespan (process pool)
+"""
+from functools import partial
+
+import blosc2
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import _result_cache, _result_cache_key, app
+from app.physics.calculator import quantum_tunneling_simulation_binary
+
+PARAMS = dict(N=200, t_max=0.2)
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    _result_cache.clear()
+    yield
+    _result_cache.clear()
+
+
+def test_result_cache_key_keeps_si_scale_values_apart():
+    """Tiny SI-unit values must not round to the same key"""
+    electron = partial(quantum_tunneling_simulation_binary, hbar=1.054e-34, mass=9.1e-31)
+    proton = partial(quantum_tunneling_simulation_binary, hbar=6.6e-16, mass=1.67e-27)
+    assert _result_cache_key(electron) != _result_cache_key(proton)
+
+
+def test_result_cache_key_absorbs_float_noise():
+    noisy = partial(quantum_tunneling_simulation_binary, dt=0.1 + 0.2)
+    exact = partial(quantum_tunneling_simulation_binary, dt=0.3)
+    assert _result_cache_key(noisy) == _result_cache_key(exact)
+
+
+def test_repeated_request_is_served_from_the_result_cache(client):
+    first = client.post("/api/quantum-tunneling", json=PARAMS)
+    second = client.post("/api/quantum-tunneling", json=PARAMS)
+    other = client.post("/api/quantum-tunneling", json=dict(PARAMS, sigma=0.2))
+
+    assert first.status_code == second.status_code == other.status_code == 200
+    assert first.content == second.content != other.content
+    assert len(_result_cache) == 2
+
+
+def test_blosc2_round_trip_and_vary_header(client):
+    raw = client.post("/api/quantum-tunneling", json=PARAMS)
+    compressed = client.post("/api/quantum-tunneling", json=PARAMS,
+                             headers={"Accept-Encoding": "blosc2"})
+
+    assert "content-encoding" not in raw.headers
+    assert compressed.headers["content-encoding"] == "blosc2"
+    assert blosc2.decompress(compressed.content) == raw.content
+    for response in (raw, compressed):
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_grid_etag_revalidation(client):
+    grid = client.get("/api/v1/quantum/grid", params={"N": 200})
+    assert grid.status_code == 200
+    etag = grid.headers["etag"]
+
+    revalidated = client.get("/api/v1/quantum/grid", params={"N": 200},
+                             headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    other = client.get("/api/v1/quantum/grid", params={"N": 201},
+                       headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
+
+
+def test_coarse_crank_nicolson_dt_is_rejected_with_422(client):
+    response = client.post("/api/quantum-tunneling",
+                           json=dict(PARAMS, method="crank-nicolson"))
+    assert response.status_code == 422
+    assert "too large for Crank-Nicolson" in response.json()["detail"]
+
+
+def test_json_endpoint_rejects_non_default_method_with_422(client):
+    response = client.post("/api/v1/quantum/simulate",
+                           json=dict(PARAMS, method="crank-nicolson"))
+    assert response.status_code == 422
+
+    assert client.post("/api/v1/quantum/simulate", json=PARAMS).status_code == 200
@@ -0,0 +1,46 @@
+"""
+Consistency checks between the simulation endpoints
+"""
+import numpy as np
+import pytest
+
+from app.physics.calculator import (
+    SimulationParameterError,
+    quantum_tunneling_simulation_binary,
+    quantum_wave_packet_simulation
+)
+
+PARAMS = dict(N=300, t_max=0.5)
+
+
+def _binary_frames(**params) -> np.ndarray:
+    """|psi| frames decoded from the binary payload"""
+    payload = quantum_tunneling_simulation_binary(**params)
+    frame_count, grid_size = np.frombuffer(payload, dtype="<u4", count=2)
+    psi = np.frombuffer(payload, dtype=np.float32, count=2 * grid_size * frame_count,
+                        offset=8 + 4 * grid_size).reshape(frame_count, 2, grid_size)
+    return np.hypot(psi[:, 0], psi[:, 1])
+
+
+def test_json_and_binary_endpoints_agree():
+    """JSON |psi| frames match the binary payload's spectral frames"""
+    json_frames = quantum_wave_packet_simulation(**PARAMS)["time_evolution"]
+    binary_frames = _binary_frames(**PARAMS)
+    
+    assert json_frames.shape == binary_frames.shape
+    assert np.abs(json_frames - binary_frames).max() < 1e-2 * binary_frames.max()
+
+
+def test_crank_nicolson_rejects_coarse_dt():
+    """The default dt is far too coarse for Crank-Nicolson on this grid"""
+    with pytest.raises(SimulationParameterError, match="too large for Crank-Nicolson"):
+        quantum_tunneling_simulation_binary(method="crank-nicolson", **PARAMS)
+
+
+def test_crank_nicolson_matches_spectral_when_accepted():
+    """At an accepted dt, Crank-Nicolson frames match the spectral frames"""
+    params = dict(PARAMS, dt=5e-5, t_max=0.1)
+    spectral = _binary_frames(**params)
+    crank_nicolson = _binary_frames(method="crank-nicolson", **params)
+    
+    assert np.abs(crank_nicolson - spectral).max() < 1e-2 * spectral.max()